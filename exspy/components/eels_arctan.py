@@ -48,10 +48,16 @@ class EELSArctan(hs.model.components1D.Expression):
         step.
     x0 : float
         Center parameter (:math:`f(x_0)=A`).
+    module : None or str, default None
+        Module used to evaluate the function. If None, ``"numexpr"`` is used
+        if installed, otherwise ``"numpy"``.
+    **kwargs
+        Extra keyword arguments are passed to the
+        :py:class:`~._components.expression.Expression` component.
 
     """
 
-    def __init__(self, A=1.0, k=1.0, x0=1.0, module=["numpy"], **kwargs):
+    def __init__(self, A=1.0, k=1.0, x0=1.0, module=None, **kwargs):
         # To be able to still read old file versions that contain this argument
         if "minimum_at_zero" in kwargs:
             del kwargs["minimum_at_zero"]
@@ -114,45 +114,45 @@ class DoublePowerLaw(hs.model.components1D.Expression):
         return self.function(x) / self.A.value
 
     def grad_r(self, x):
+        A = self.A.value
+        r = self.r.value
+        dx = x - self.origin.value
+        dx_shift = dx - self.shift.value
         return np.where(
             x > self.left_cutoff.value,
-            -self.A.value
-            * self.ratio.value
-            * (x - self.origin.value - self.shift.value) ** (-self.r.value)
-            * np.log(x - self.origin.value - self.shift.value)
-            - self.A.value
-            * (x - self.origin.value) ** (-self.r.value)
-            * np.log(x - self.origin.value),
+            -A
+            * (
+                self.ratio.value * dx_shift ** (-r) * np.log(dx_shift)
+                + dx ** (-r) * np.log(dx)
+            ),
             0,
         )
 
     def grad_origin(self, x):
+        r = self.r.value
+        dx = x - self.origin.value
+        dx_shift = dx - self.shift.value
         return np.where(
             x > self.left_cutoff.value,
             self.A.value
-            * self.r.value
-            * self.ratio.value
-            * (x - self.origin.value - self.shift.value) ** (-self.r.value - 1)
-            + self.A.value
-            * self.r.value
-            * (x - self.origin.value) ** (-self.r.value - 1),
+            * r
+            * (self.ratio.value * dx_shift ** (-r - 1) + dx ** (-r - 1)),
             0,
         )
 
     def grad_shift(self, x):
+        r = self.r.value
+        dx_shift = x - self.origin.value - self.shift.value
         return np.where(
             x > self.left_cutoff.value,
-            self.A.value
-            * self.r.value
-            * self.ratio.value
-            * (x - self.origin.value - self.shift.value) ** (-self.r.value - 1),
+            self.A.value * r * self.ratio.value * dx_shift ** (-r - 1),
             0,
         )
 
     def grad_ratio(self, x):
+        dx_shift = x - self.origin.value - self.shift.value
         return np.where(
             x > self.left_cutoff.value,
-            self.A.value
-            * (x - self.origin.value - self.shift.value) ** (-self.r.value),
+            self.A.value * dx_shift ** (-self.r.value),
             0,
         )
@@ -93,26 +93,19 @@ class SEE(hs.model.components1D.Expression):
 
     def grad_A(self, x):
         """ """
-        return np.where(
-            x > self.Phi.value,
-            (x - self.Phi.value) / (x - self.Phi.value + self.B.value) ** 4,
-            0,
-        )
+        Phi = self.Phi.value
+        dx = x - Phi
+        return np.where(x > Phi, dx / (dx + self.B.value) ** 4, 0)
 
     def grad_Phi(self, x):
         """ """
-        return np.where(
-            x > self.Phi.value,
-            (4 * (x - self.Phi.value) * self.A.value)
-            / (self.B.value + x - self.Phi.value) ** 5
-            - self.A.value / (self.B.value + x - self.Phi.value) ** 4,
-            0,
-        )
+        A = self.A.value
+        Phi = self.Phi.value
+        dx = x - Phi
+        dxB = dx + self.B.value
+        return np.where(x > Phi, (4 * dx * A) / dxB**5 - A / dxB**4, 0)
 
     def grad_B(self, x):
-        return np.where(
-            x > self.Phi.value,
-            -(4 * (x - self.Phi.value) * self.A.value)
-            / (self.B.value + x - self.Phi.value) ** 5,
-            0,
-        )
+        Phi = self.Phi.value
+        dx = x - Phi
+        return np.where(x > Phi, -(4 * dx * self.A.value) / (dx + self.B.value) ** 5, 0)
@@ -18,9 +18,11 @@
 
 import numpy as np
 import math
+from scipy.special import wofz
 
 from hyperspy.component import Component, _get_scaling_factor
 from hyperspy._components.gaussian import _estimate_gaussian_parameters
+from hyperspy.docstrings.parameters import FUNCTION_ND_DOCSTRING
 
 
 sqrt2pi = math.sqrt(2 * math.pi)
@@ -74,8 +76,6 @@ def voigt(x, FWHM=1, gamma=1, center=0, scale=1):
     doi:10.1107/S0021889886089999
     """
     # wofz function = w(z) = Fad[d][e][y]eva function = exp(-z**2)erfc(-iz)
-    from scipy.special import wofz
-
     sigma = FWHM / 2.3548200450309493
     z = (np.asarray(x) - center + 1j * gamma) / (sigma * math.sqrt(2))
     V = wofz(z) / (math.sqrt(2 * np.pi) * sigma)
@@ -156,16 +156,7 @@ class PESVoigt(Component):
         self.isbackground = False
         self.convolved = True
 
-    def function(self, x):
-        area = self.area.value * self.transmission_function.value
-        centre = self.centre.value
-        ab = self.non_isochromaticity.value
-        if self.resolution.value == 0:
-            FWHM = self.FWHM.value
-        else:
-            FWHM = math.sqrt(self.FWHM.value**2 + self.resolution.value**2)
-        gamma = self.gamma.value
-        k = self.shirley_background.value
+    def _function(self, x, area, centre, FWHM, gamma, ab, k):
         f = voigt(x, FWHM=FWHM, gamma=gamma, center=centre - ab, scale=area)
         if self.spin_orbit_splitting:
             ratio = self.spin_orbit_branching_ratio
@@ -179,13 +170,52 @@ class PESVoigt(Component):
             )
             f += f2
         if self.shirley_background.active:
-            cf = np.cumsum(f)
-            cf = cf[-1] - cf
+            # cumulative sum along the signal axis to work with `function_nd`
+            cf = np.cumsum(f, axis=-1)
+            cf = cf[..., -1:] - cf
             self.cf = cf
             return cf * k + f
         else:
             return f
 
+    def function(self, x):
+        area = self.area.value * self.transmission_function.value
+        if self.resolution.value == 0:
+            FWHM = self.FWHM.value
+        else:
+            FWHM = math.sqrt(self.FWHM.value**2 + self.resolution.value**2)
+        return self._function(
+            x,
+            area,
+            self.centre.value,
+            FWHM,
+            self.gamma.value,
+            self.non_isochromaticity.value,
+            self.shirley_background.value,
+        )
+
+    def function_nd(self, axis):
+        """%s"""
+        if self._is_navigation_multidimensional:
+            x = axis[np.newaxis, :]
+            area = self.area.map["values"] * self.transmission_function.map["values"]
+            FWHM = self.FWHM.map["values"]
+            resolution = self.resolution.map["values"]
+            FWHM = np.where(resolution == 0, FWHM, np.sqrt(FWHM**2 + resolution**2))
+            return self._function(
+                x,
+                area[..., np.newaxis],
+                self.centre.map["values"][..., np.newaxis],
+                FWHM[..., np.newaxis],
+                self.gamma.map["values"][..., np.newaxis],
+                self.non_isochromaticity.map["values"][..., np.newaxis],
+                self.shirley_background.map["values"][..., np.newaxis],
+            )
+        else:
+            return self.function(axis)
+
+    function_nd.__doc__ %= FUNCTION_ND_DOCSTRING
+
     def estimate_parameters(self, signal, E1, E2, only_current=False):
         """Estimate the Voigt function by calculating the momenta of the
         Gaussian.
@@ -232,20 +262,19 @@ class PESVoigt(Component):
             signal, E1, E2, only_current
         )
         scaling_factor = _get_scaling_factor(signal, axis, centre)
+        area = height * sigma * sqrt2pi
+        if axis.is_binned:
+            area = area / scaling_factor
 
         if only_current is True:
             self.centre.value = centre
             self.FWHM.value = sigma * sigma2fwhm
-            self.area.value = height * sigma * sqrt2pi
-            if axis.is_binned:
-                self.area.value /= scaling_factor
+            self.area.value = area
             return True
         else:
             if self.area.map is None:
                 self._create_arrays()
-            self.area.map["values"][:] = height * sigma * sqrt2pi
-            if axis.is_binned:
-                self.area.map["values"][:] /= scaling_factor
+            self.area.map["values"][:] = area
             self.area.map["is_set"][:] = True
             self.FWHM.map["values"][:] = sigma * sigma2fwhm
             self.FWHM.map["is_set"][:] = True
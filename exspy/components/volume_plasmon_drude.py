@@ -80,11 +80,20 @@ class VolumePlasmonDrude(hs.model.components1D.Expression):
             **kwargs,
         )
 
+    def _grad_terms(self, x):
+        # Sub-expressions shared by the gradients
+        x2 = x**2
+        pe2 = self.plasmon_energy.value**2
+        fwhm2 = self.fwhm.value**2
+        denominator = (x2 * (x2 + fwhm2 - 2 * pe2) + pe2**2) ** 2
+        return x2, pe2, fwhm2, denominator
+
     # Partial derivative with respect to the plasmon energy E_p
     def grad_plasmon_energy(self, x):
         plasmon_energy = self.plasmon_energy.value
         fwhm = self.fwhm.value
         intensity = self.intensity.value
+        x2, pe2, fwhm2, denominator = self._grad_terms(x)
 
         return np.where(
             x > 0,
@@ -93,30 +102,22 @@ class VolumePlasmonDrude(hs.model.components1D.Expression):
             * fwhm
             * plasmon_energy
             * intensity
-            * (
-                (x**4 + (x * fwhm) ** 2 - plasmon_energy**4)
-                / (x**4 + x**2 * (fwhm**2 - 2 * plasmon_energy**2) + plasmon_energy**4)
-                ** 2
-            ),
+            * ((x2 * (x2 + fwhm2) - pe2**2) / denominator),
             0,
         )
 
     # Partial derivative with respect to the plasmon linewidth delta_E_p
     def grad_fwhm(self, x):
         plasmon_energy = self.plasmon_energy.value
-        fwhm = self.fwhm.value
         intensity = self.intensity.value
+        x2, pe2, fwhm2, denominator = self._grad_terms(x)
 
         return np.where(
             x > 0,
             x
             * plasmon_energy
             * intensity
-            * (
-                (x**4 - x**2 * (2 * plasmon_energy**2 + fwhm**2) + plasmon_energy**4)
-                / (x**4 + x**2 * (fwhm**2 - 2 * plasmon_energy**2) + plasmon_energy**4)
-                ** 2
-            ),
+            * ((x2 * (x2 - 2 * pe2 - fwhm2) + pe2**2) / denominator),
             0,
         )
 
@@ -443,21 +443,31 @@ def quantification_cliff_lorimer(
     else:
         absorption_correction = absorption_correction.reshape(dim[0], dim2)
 
-    for i in range(dim2):
-        index = np.where(intens[:, i] > min_intensity)[0]
-        if len(index) > 1:
-            ref_index, ref_index2 = index[:2]
-            intens[:, i] = _quantification_cliff_lorimer(
-                intens[:, i],
+    above_threshold = intens > min_intensity
+    n_above_threshold = above_threshold.sum(axis=0)
+    quantified = np.flatnonzero(n_above_threshold > 1)
+    single = np.flatnonzero(n_above_threshold == 1)
+    single_index = above_threshold[:, single].argmax(axis=0)
+    if quantified.size:
+        # The first two lines above the threshold are used as reference.
+        # The pixels sharing the same pair of references are quantified
+        # together, as a block, rather than one at a time.
+        ref_indices = np.argsort(
+            ~above_threshold[:, quantified], axis=0, kind="stable"
+        )[:2]
+        pairs, inverse = np.unique(ref_indices, axis=1, return_inverse=True)
+        inverse = inverse.ravel()
+        for j, (ref_index, ref_index2) in enumerate(pairs.T):
+            pixels = quantified[inverse == j]
+            intens[:, pixels] = _quantification_cliff_lorimer(
+                intens[:, pixels],
                 kfactors,
-                absorption_correction[:, i],
+                absorption_correction[:, pixels],
                 ref_index,
                 ref_index2,
             )
-        else:
-            intens[:, i] = np.zeros_like(intens[:, i])
-            if len(index) == 1:
-                intens[index[0], i] = 1.0
+    intens[:, n_above_threshold < 2] = 0.0
+    intens[single_index, single] = 1.0
 
     intens = intens.reshape(dim)
     if mask is not None:
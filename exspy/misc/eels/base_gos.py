@@ -132,21 +132,20 @@ class TabulatedGOS(BaseGOS):
         # tabulated GOS
         gamma = 1 + E0 / 511.06
         T = 511060 * (1 - 1 / gamma**2) / 2
+        # Calculate the limits of the q integral for all energies at once
+        E = self.energy_axis + energy_shift
+        qa0sqmin = (E**2) / (4 * R * T) + (E**3) / (8 * gamma**3 * R * T**2)
+        p02 = T / (R * (1 - 2 * T / 511060))
+        pp2 = p02 - E / R * (gamma - E / 1022120)
+        qa0sqmax = qa0sqmin + 4 * np.sqrt(p02 * pp2) * (math.sin(angle / 2)) ** 2
+        qmin = np.sqrt(qa0sqmin) / a0
+        qmax = np.sqrt(qa0sqmax) / a0
         for i in range(0, self.gos_array.shape[0]):
-            E = self.energy_axis[i] + energy_shift
-            # Calculate the limits of the q integral
-            qa0sqmin = (E**2) / (4 * R * T) + (E**3) / (8 * gamma**3 * R * T**2)
-            p02 = T / (R * (1 - 2 * T / 511060))
-            pp2 = p02 - E / R * (gamma - E / 1022120)
-            qa0sqmax = qa0sqmin + 4 * np.sqrt(p02 * pp2) * (math.sin(angle / 2)) ** 2
-            qmin = math.sqrt(qa0sqmin) / a0
-            qmax = math.sqrt(qa0sqmax) / a0
             # Perform the integration in a log grid
-            qaxis, gos = self.get_qaxis_and_gos(i, qmin, qmax)
+            qaxis, gos = self.get_qaxis_and_gos(i, qmin[i], qmax[i])
             logsqa0qaxis = np.log((a0 * qaxis) ** 2)
             qint[i] = integrate.simpson(gos, x=logsqa0qaxis)
-        E = self.energy_axis + energy_shift
         # Energy differential cross section in (barn/eV/atom)
-        qint *= (4.0 * np.pi * a0**2.0 * R**2 / E / T * self.subshell_factor) * 1e28
+        qint *= (4.0 * np.pi * a0**2 * R**2 / E / T * self.subshell_factor) * 1e28
         self.qint = qint
         return interpolate.make_interp_spline(E, qint, k=3)
@@ -16,6 +16,7 @@
 # You should have received a copy of the GNU General Public License
 # along with eXSpy. If not, see <https://www.gnu.org/licenses/#GPL>.
 
+import functools
 import logging
 
 import h5py
@@ -37,6 +38,51 @@ _GOSH_URL = f"doi:{_GOSH_DOI}/Segger_Guzzinati_Kohl_1.5.0.gosh"
 _GOSH_KNOWN_HASH = "md5:7fee8891c147a4f769668403b54c529b"
 
 
+@functools.lru_cache(maxsize=None)
+def _retrieve_gosh_file():
+    # pooch checks the hash of the whole file on every call
+    return pooch.retrieve(
+        url=_GOSH_URL,
+        known_hash=_GOSH_KNOWN_HASH,
+        progressbar=preferences.General.show_progressbar,
+    )
+
+
+@functools.lru_cache(maxsize=128)
+def _read_gosh_table(gos_file_path, element, subshell):
+    """Read the GOS table of an element subshell from a GOSH file.
+
+    The result is cached, as models usually create several edges with the
+    same element subshell, e.g. when creating or restoring models.
+
+    Returns
+    -------
+    subshell_factor, gos, q, free_energies, doi
+    """
+    error_message = (
+        "The GOSH Parametrized GOS database does not "
+        f"contain a valid entry the {subshell} subshell "
+        f"of {element}. Please select a different database."
+    )
+
+    with h5py.File(gos_file_path, "r") as h:
+        conventions = h["metadata/edges_info"]
+        if subshell not in conventions:
+            raise ValueError(error_message)
+        table = conventions[subshell].attrs["table"]
+        subshell_factor = conventions[subshell].attrs["occupancy_ratio"]
+        stem = f"/{element}/{table}"
+        if stem not in h:
+            raise ValueError(error_message)
+        gos_group = h[stem]
+        gos = gos_group["data"][:]
+        q = gos_group["q"][:]
+        free_energies = gos_group["free_energies"][:]
+        doi = h["/metadata/data_ref"].attrs["data_doi"]
+
+    return subshell_factor, gos, q, free_energies, doi
+
+
 class GoshGOS(TabulatedGOS):
     """Read Generalized Oscillator Strength from a GOSH database.
 
@@ -90,11 +136,7 @@ class GoshGOS(TabulatedGOS):
         """
 
         if gos_file_path is None:
-            gos_file_path = pooch.retrieve(
-                url=_GOSH_URL,
-                known_hash=_GOSH_KNOWN_HASH,
-                progressbar=preferences.General.show_progressbar,
-            )
+            gos_file_path = _retrieve_gosh_file()
         self.gos_file_path = gos_file_path
         super().__init__(element_subshell=element_subshell)
 
@@ -105,33 +147,13 @@ class GoshGOS(TabulatedGOS):
             f"\tSubshell: {self.subshell}"
             f"\tOnset Energy = {self.onset_energy}"
         )
-        element = self.element
-        subshell = self.subshell
-
-        error_message = (
-            "The GOSH Parametrized GOS database does not "
-            f"contain a valid entry the {subshell} subshell "
-            f"of {element}. Please select a different database."
+        subshell_factor, gos, q, free_energies, doi = _read_gosh_table(
+            self.gos_file_path, self.element, self.subshell
         )
-
-        with h5py.File(self.gos_file_path, "r") as h:
-            conventions = h["metadata/edges_info"]
-            if subshell not in conventions:
-                raise ValueError(error_message)
-            table = conventions[subshell].attrs["table"]
-            self.subshell_factor = conventions[subshell].attrs["occupancy_ratio"]
-            stem = f"/{element}/{table}"
-            if stem not in h:
-                raise ValueError(error_message)
-            gos_group = h[stem]
-            gos = gos_group["data"][:]
-            q = gos_group["q"][:]
-            free_energies = gos_group["free_energies"][:]
-            doi = h["/metadata/data_ref"].attrs["data_doi"]
-
-        gos = np.squeeze(gos.T)
+        self.subshell_factor = subshell_factor
         self.doi = doi
-        self.gos_array = gos
-        self.qaxis = q
+        # Copy the cached arrays so that the instances don't share them
+        self.gos_array = np.squeeze(gos.T).copy()
+        self.qaxis = q.copy()
         self.rel_energy_axis = free_energies - min(free_energies)
         self.energy_axis = self.rel_energy_axis + self.onset_energy
@@ -117,11 +117,30 @@ class HydrogenicGOS(BaseGOS):
         self.read_elements()
         self.energy_shift = 0
 
+        # The screened nuclear charge and the correction factor only depend
+        # on the element: compute them once rather than in every evaluation
+        # of the integrand of the q integral.
         if self.subshell[:1] == "K":
             self.gosfunc = self.gosfuncK
+            if self.Z != 1:
+                self._zs = self.Z - 0.5
+                self._rnk = 2
+            else:
+                self._zs = 1.0
+                self._rnk = 1
             self.rel_energy_axis = self.get_parametrized_energy_axis(50, 3, 50)
         elif self.subshell[:1] == "L":
             self.gosfunc = self.gosfuncL
+            self._zs = self.Z - 0.35 * (8 - 1) - 1.7
+            iz = self.Z - 11
+            if iz >= len(XU):
+                # Egerton does not tabulate the correction for Z>36.
+                # This produces XSs that are within 10% of Hartree-Slater XSs
+                # for these elements.
+                self._u = 0.1
+            else:
+                # Egerton's correction to the Hydrogenic XS
+                self._u = XU[int(iz)]
             self.onset_energy_L3 = self.element_dict["Atomic_properties"][
                 "Binding_energies"
             ]["L3"]["onset_energy (eV)"]
@@ -159,12 +178,18 @@ class HydrogenicGOS(BaseGOS):
         gamma = 1 + E0 / 511.06
         T = 511060 * (1 - 1 / gamma**2) / 2
         qint = np.zeros((self.energy_axis.shape[0]))
-        for i, E in enumerate(self.energy_axis + energy_shift):
-            qa0sqmin = (E**2) / (4 * R * T) + (E**3) / (8 * gamma**3 * R * T**2)
-            p02 = T / (R * (1 - 2 * T / 511060))
-            pp2 = p02 - E / R * (gamma - E / 1022120)
-            qa0sqmax = qa0sqmin + 4 * np.sqrt(p02 * pp2) * (math.sin(angle / 2)) ** 2
-
+        # The limits of the q integral only depend on the energy axis and
+        # can be calculated for all energies at once
+        energies = self.energy_axis + energy_shift
+        qa0sqmin = (energies**2) / (4 * R * T) + (energies**3) / (
+            8 * gamma**3 * R * T**2
+        )
+        p02 = T / (R * (1 - 2 * T / 511060))
+        pp2 = p02 - energies / R * (gamma - energies / 1022120)
+        qa0sqmax = qa0sqmin + 4 * np.sqrt(p02 * pp2) * (math.sin(angle / 2)) ** 2
+        log_qa0sqmin = np.log(qa0sqmin)
+        log_qa0sqmax = np.log(qa0sqmax)
+        for i, E in enumerate(energies):
             # dsbyde IS THE ENERGY-DIFFERENTIAL X-SECN (barn/eV/atom)
             qint[i] = (
                 3.5166e8
@@ -172,44 +197,40 @@ class HydrogenicGOS(BaseGOS):
                 * (R / E)
                 * (
                     integrate.quad(
-                        lambda x: self.gosfunc(E, np.exp(x)),
-                        math.log(qa0sqmin),
-                        math.log(qa0sqmax),
+                        lambda x: self.gosfunc(E, math.exp(x)),
+                        log_qa0sqmin[i],
+                        log_qa0sqmax[i],
                     )[0]
                 )
             )
         self.qint = qint
         return interpolate.make_interp_spline(
-            self.energy_axis + energy_shift,
+            energies,
             qint,
             k=1,
         )
 
     def gosfuncK(self, E, qa02):
         # gosfunc calculates (=DF/DE) which IS PER EV AND PER ATOM
-        z = self.Z
         r = 13.606
-        zs = 1.0
-        rnk = 1
-        if z != 1:
-            zs = z - 0.5
-            rnk = 2
+        zs = self._zs
+        rnk = self._rnk
 
         q = qa02 / zs**2
         kh2 = E / (r * zs**2) - 1
-        akh = np.sqrt(abs(kh2))
+        akh = math.sqrt(abs(kh2))
         if akh < 0.01:
             akh = 0.01
         if kh2 >= 0.0:
-            d = 1 - np.e ** (-2 * np.pi / akh)
-            bp = np.arctan(2 * akh / (q - kh2 + 1))
+            d = 1 - math.exp(-2 * math.pi / akh)
+            bp = math.atan(2 * akh / (q - kh2 + 1))
             if bp < 0:
-                bp = bp + np.pi
-            c = np.e ** ((-2 / akh) * bp)
+                bp = bp + math.pi
+            c = math.exp((-2 / akh) * bp)
         else:
             d = 1
-            y = -1 / akh * np.log((q + 1 - kh2 + 2 * akh) / (q + 1 - kh2 - 2 * akh))
-            c = np.e**y
+            y = -1 / akh * math.log((q + 1 - kh2 + 2 * akh) / (q + 1 - kh2 - 2 * akh))
+            c = math.exp(y)
         a = ((q - kh2 + 1) ** 2 + 4 * kh2) ** 3
         return 128 * rnk * E / (r * zs**4) * c / d * (q + kh2 / 3 + 1 / 3) / (a * r)
 
@@ -220,57 +241,45 @@ class HydrogenicGOS(BaseGOS):
 
         z = self.Z
         r = 13.606
-        zs = z - 0.35 * (8 - 1) - 1.7
-        iz = z - 11
-        if iz >= len(XU):
-            # Egerton does not tabulate the correction for Z>36.
-            # This produces XSs that are within 10% of Hartree-Slater XSs
-            # for these elements.
-            u = 0.1
-        else:
-            # Egerton's correction to the Hydrogenic XS
-            u = XU[int(iz)]
+        zs = self._zs
+        u = self._u
         el3 = self.onset_energy_L3 + self.energy_shift
         el1 = self.onset_energy_L1 + self.energy_shift
 
         q = qa02 / zs**2
         kh2 = E / (r * zs**2) - 0.25
-        akh = np.sqrt(abs(kh2))
+        akh = math.sqrt(abs(kh2))
         if kh2 >= 0.0:
-            d = 1 - np.exp(-2 * np.pi / akh)
-            bp = np.arctan(akh / (q - kh2 + 0.25))
+            d = 1 - math.exp(-2 * math.pi / akh)
+            bp = math.atan(akh / (q - kh2 + 0.25))
             if bp < 0:
-                bp = bp + np.pi
-            c = np.exp((-2 / akh) * bp)
+                bp = bp + math.pi
+            c = math.exp((-2 / akh) * bp)
         else:
             d = 1
-            y = -1 / akh * np.log((q + 0.25 - kh2 + akh) / (q + 0.25 - kh2 - akh))
-            c = np.exp(y)
+            y = -1 / akh * math.log((q + 0.25 - kh2 + akh) / (q + 0.25 - kh2 - akh))
+            c = math.exp(y)
 
         if E - el1 <= 0:
+            # Polynomial in q evaluated in Horner form, its coefficients
+            # being polynomials in kh2 also in Horner form
             g = (
-                2.25 * q**4
-                - (0.75 + 3 * kh2) * q**3
-                + (0.59375 - 0.75 * kh2 - 0.5 * kh2**2) * q * q
-                + (0.11146 + 0.85417 * kh2 + 1.8833 * kh2 * kh2 + kh2**3) * q
-                + 0.0035807
-                + kh2 / 21.333
-                + kh2 * kh2 / 4.5714
-                + kh2**3 / 2.4
-                + kh2**4 / 4
+                (
+                    (2.25 * q - (0.75 + 3 * kh2)) * q
+                    + (0.59375 - kh2 * (0.75 + 0.5 * kh2))
+                )
+                * q
+                + (0.11146 + kh2 * (0.85417 + kh2 * (1.8833 + kh2)))
+            ) * q + (
+                0.0035807
+                + kh2 * (1 / 21.333 + kh2 * (1 / 4.5714 + kh2 * (1 / 2.4 + kh2 / 4)))
             )
 
             a = ((q - kh2 + 0.25) ** 2 + kh2) ** 5
         else:
             g = (
-                q**3
-                - (5 / 3 * kh2 + 11 / 12) * q**2
-                + (kh2 * kh2 / 3 + 1.5 * kh2 + 65 / 48) * q
-                + kh2**3 / 3
-                + 0.75 * kh2 * kh2
-                + 23 / 48 * kh2
-                + 5 / 64
-            )
+                (q - (5 / 3 * kh2 + 11 / 12)) * q + (65 / 48 + kh2 * (1.5 + kh2 / 3))
+            ) * q + (5 / 64 + kh2 * (23 / 48 + kh2 * (0.75 + kh2 / 3)))
             a = ((q - kh2 + 0.25) ** 2 + kh2) ** 4
         rf = ((E + 0.1 - el3) / 1.8 / z / z) ** u
         # The following commented lines are to give a more accurate GOS
@@ -404,11 +404,10 @@ def _mass_absorption_mixture(weight_percent, elements, energies):
     if isinstance(weight_percent[0], Iterable):
         weight_fraction = np.array(weight_percent)
         weight_fraction /= np.sum(weight_fraction, 0)
-        mac_res = np.zeros([len(energies)] + list(weight_fraction.shape[1:]))
-        for element, weight in zip(elements, weight_fraction):
-            mac_re = mass_absorption_coefficient(element, energies)
-            mac_res += np.array([weight * ma for ma in mac_re])
-        return mac_res
+        # Contract the (elements, energies) coefficients with the
+        # (elements, ...) weight fractions in a single operation
+        macs = np.array([mass_absorption_coefficient(el, energies) for el in elements])
+        return np.tensordot(macs, weight_fraction, axes=(0, 0))
     else:
         mac_res = np.array(
             [mass_absorption_coefficient(el, energies) for el in elements]
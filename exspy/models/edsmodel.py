@@ -80,7 +80,7 @@ def _get_sigma(E, E_ref, units_factor, return_f=False):
     energy2sigma_factor = 2.5 / (eV2keV * (sigma2fwhm**2))
     if return_f:
         return lambda sig_ref: math.sqrt(
-            abs(energy2sigma_factor * (E - E_ref) * units_factor + np.power(sig_ref, 2))
+            abs(energy2sigma_factor * (E - E_ref) * units_factor + sig_ref**2)
         )
     else:
         return "sqrt(abs({} * ({} - {}) * {} + sig_ref ** 2))".format(
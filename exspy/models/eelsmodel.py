@@ -176,51 +176,54 @@ class EELSModel(Model1D):
         if weights is None:
             weights = 1.0
 
+        # Get the low-loss data of the current pixel once, rather than for
+        # each free parameter and twin
+        low_loss = self.low_loss._get_current_data(self.axes_manager)
+        # Fill the gradients of the free parameters row by row in a
+        # preallocated array instead of stacking them afterwards
+        active_components = [component for component in self if component.active]
+        n_free_parameters = sum(
+            len(component.free_parameters) for component in active_components
+        )
+        grad = np.empty((n_free_parameters, len(self.axis.axis)))
         counter = 0
-        grad = np.zeros(len(self.axis.axis))
-        for component in self:  # Cut the parameters list
-            if component.active:
-                component.fetch_values_from_array(
-                    param[counter : counter + component._nfree_param], onlyfree=True
-                )
+        row = 0
+        for component in active_components:  # Cut the parameters list
+            component.fetch_values_from_array(
+                param[counter : counter + component._nfree_param], onlyfree=True
+            )
 
-                if component.convolved:
-                    for parameter in component.free_parameters:
-                        par_grad = np.convolve(
-                            parameter.grad(self.convolution_axis),
-                            self.low_loss._get_current_data(self.axes_manager),
-                            mode="valid",
-                        )
+            if component.convolved:
+                for parameter in component.free_parameters:
+                    grad[row] = np.convolve(
+                        parameter.grad(self.convolution_axis),
+                        low_loss,
+                        mode="valid",
+                    )
 
-                        if parameter._twins:
-                            for par in parameter._twins:
-                                np.add(
-                                    par_grad,
-                                    np.convolve(
-                                        par.grad(self.convolution_axis),
-                                        self.low_loss._get_current_data(
-                                            self.axes_manager
-                                        ),
-                                        mode="valid",
-                                    ),
-                                    par_grad,
-                                )
-
-                        grad = np.vstack((grad, par_grad))
+                    if parameter._twins:
+                        for par in parameter._twins:
+                            grad[row] += np.convolve(
+                                par.grad(self.convolution_axis),
+                                low_loss,
+                                mode="valid",
+                            )
 
-                else:
-                    for parameter in component.free_parameters:
-                        par_grad = parameter.grad(self.axis.axis)
+                    row += 1
+
+            else:
+                for parameter in component.free_parameters:
+                    grad[row] = parameter.grad(self.axis.axis)
 
-                        if parameter._twins:
-                            for par in parameter._twins:
-                                np.add(par_grad, par.grad(self.axis.axis), par_grad)
+                    if parameter._twins:
+                        for par in parameter._twins:
+                            grad[row] += par.grad(self.axis.axis)
 
-                        grad = np.vstack((grad, par_grad))
+                    row += 1
 
-                counter += component._nfree_param
+            counter += component._nfree_param
 
-        to_return = grad[1:, self._channel_switches] * weights
+        to_return = grad[:, self._channel_switches] * weights
 
         if self.axis.is_binned:
             if self.axis.is_uniform:
@@ -23,6 +23,7 @@ import numpy as np
 import dask.array as da
 import traits.api as t
 from scipy import constants
+from scipy.integrate import simpson
 from prettytable import PrettyTable
 
 import hyperspy.api as hs
@@ -619,8 +620,6 @@ class EELSSpectrum(Signal1D):
                     if binned:
                         return data.sum()
                     else:
-                        from scipy.integrate import simpson
-
                         axis = ax.axis[:ind]
                         return simpson(y=data, x=axis)
 
@@ -1582,7 +1581,7 @@ class EELSSpectrum(Signal1D):
                 Srfelf = 4 * e2 / ((e1 + 1) ** 2 + e2**2) - Im
                 adep = tgt / (eaxis + delta) * np.arctan(
                     beta * tgt / axis.axis
-                ) - beta / 1000.0 / (beta**2 + axis.axis**2.0 / tgt**2)
+                ) - beta / 1000.0 / (beta**2 + axis.axis**2 / tgt**2)
                 Srfint = 2000 * K * adep * Srfelf / rk0 / te * axis.scale
                 s.data = sorig.data - Srfint
                 _logger.debug("Iteration number: %d / %d", io + 1, iterations)
@@ -78,6 +78,32 @@ def test_function_shirleybackground():
     assert g._position is g.centre
 
 
+@pytest.mark.parametrize("shirley_background", [False, True])
+@pytest.mark.parametrize("resolution", [0.0, 0.7])
+def test_function_nd(shirley_background, resolution):
+    g = PESVoigt()
+    g.area.value = 5
+    g.FWHM.value = 0.5
+    g.gamma.value = 0.2
+    g.centre.value = 1
+    g.resolution.value = resolution
+    g.shirley_background.value = 1.5
+    g.shirley_background.active = shirley_background
+    x = np.linspace(-5, 5, 1000)
+    s = Signal1D(np.array([x] * 2))
+
+    # Manually set to test function_nd
+    g._axes_manager = s.axes_manager
+    g._create_arrays()
+    for parameter in g.parameters:
+        parameter.map["values"] = [parameter.value] * 2
+
+    values = g.function_nd(x)
+    assert values.shape == (2, len(x))
+    for v in values:
+        np.testing.assert_allclose(v, g.function(x))
+
+
 @pytest.mark.parametrize(("lazy"), (True, False))
 @pytest.mark.parametrize(("uniform"), (True, False))
 @pytest.mark.parametrize(("mapnone"), (True, False))
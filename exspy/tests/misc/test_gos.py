@@ -19,6 +19,7 @@
 from pathlib import Path
 
 import h5py
+import numpy as np
 import pooch
 import pytest
 
@@ -73,6 +74,16 @@ def test_gosh_not_in_file():
         _ = GoshGOS("Ac_L3", gos_file_path=GOSH10)
 
 
+def test_gosh_read_cached():
+    gos = GoshGOS("Ti_L3", gos_file_path=GOSH10)
+    gos2 = GoshGOS("Ti_L3", gos_file_path=GOSH10)
+    np.testing.assert_array_equal(gos.gos_array, gos2.gos_array)
+    np.testing.assert_array_equal(gos.qaxis, gos2.qaxis)
+    # The arrays read from the file are cached but not shared
+    assert gos.gos_array is not gos2.gos_array
+    assert gos.qaxis is not gos2.qaxis
+
+
 def test_binding_energy_database():
     gos = GoshGOS("Ti_L3")
     gosh15 = h5py.File(gos.gos_file_path)